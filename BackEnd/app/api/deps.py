@@ -4,8 +4,9 @@
 Предоставляют доступ к базе данных и текущему пользователю в эндпоинтах.
 """
 
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+import time
+from typing import Generator, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
@@ -13,36 +14,136 @@ from sqlalchemy.orm import Session
 from app.core import security
 from app.core.config import settings
 from app.db import models
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, ReadSessionLocal, connect_for_read, is_sticky
 
 # Схема OAuth2 для Swagger UI
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
+# Cookie с временем последней записи клиента (Unix time) для read-your-writes
+# между процессами и инстансами.
+LAST_WRITE_COOKIE = "docstatus_last_write"
 
-def get_db() -> Generator:
+
+def _token_subject(request: Request) -> Optional[str]:
+    """
+    Возвращает логин пользователя (sub) из Bearer токена запроса.
+
+    Используется как ключ read-your-writes: он одинаков для записи и
+    последующего чтения одним пользователем. Токен здесь не проверяется на
+    доступ к ресурсу - это делает get_current_user.
+
+    Args:
+        request (Request): Текущий HTTP запрос.
+
+    Returns:
+        Optional[str]: Логин или None, если токена нет или он невалиден.
     """
-    Создает сессию БД для запроса и закрывает её после завершения.
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token, settings.secret_key, algorithms=[settings.algorithm]
+        )
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+
+def _set_last_write_cookie(response: Response) -> None:
+    """
+    Сообщает клиенту время записи через cookie.
+
+    Args:
+        response (Response): Ответ текущего запроса.
+    """
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        f"{time.time():.3f}",
+        max_age=settings.replica_sticky_seconds,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def _has_recent_write_cookie(request: Request) -> bool:
+    """
+    Проверяет, выполнял ли клиент запись в пределах окна stickiness.
+
+    Cookie не подписан: подделав его, клиент может только перевести свои
+    чтения на primary.
+
+    Args:
+        request (Request): Текущий HTTP запрос.
+
+    Returns:
+        bool: True, если cookie есть и не старше replica_sticky_seconds.
+    """
+    try:
+        written_at = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() - written_at < settings.replica_sticky_seconds
+
+
+def get_db(request: Request, response: Response) -> Generator:
+    """
+    Создает сессию БД (primary) для запроса и закрывает её после завершения.
+
+    Используется для записи. После коммита с изменениями пользователь на
+    время читает из primary (см. app.db.session): признак записи ставится
+    в cookie ответа и в память процесса по логину. Эндпоинты без токена
+    (регистрация) задают db.info["sticky_key"] сами.
+
+    Args:
+        request (Request): Текущий HTTP запрос.
+        response (Response): Ответ, в который ставится cookie записи.
 
     Yields:
         Session: Сессия SQLAlchemy.
     """
     db = SessionLocal()
+    db.info["sticky_key"] = _token_subject(request)
+    db.info["on_sticky_write"] = lambda: _set_last_write_cookie(response)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request) -> Generator:
+    """
+    Создает сессию БД только для чтения.
+
+    Сессия привязана к доступной реплике (round-robin) или к primary, если
+    клиент недавно выполнял запись, реплики не настроены или недоступны.
+
+    Args:
+        request (Request): Текущий HTTP запрос.
+
+    Yields:
+        Session: Сессия SQLAlchemy.
+    """
+    use_primary = _has_recent_write_cookie(request) or is_sticky(_token_subject(request))
+    conn = connect_for_read(use_primary)
+    db = ReadSessionLocal(bind=conn)
     try:
         yield db
     finally:
         db.close()
+        conn.close()
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> models.User:
     """
     Извлекает текущего пользователя из JWT токена.
 
     Args:
         token (str): Токен из заголовка Authorization.
-        db (Session): Сессия БД.
+        db (Session): Сессия БД для чтения.
 
     Returns:
         models.User: Объект пользователя.
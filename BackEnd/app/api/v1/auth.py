@@ -44,6 +44,8 @@ def register(
         hashed_password=security.get_password_hash(user_in.password)
     )
     db.add(new_user)
+    # Сразу после регистрации клиент читает профиль по токену с этим sub
+    db.info["sticky_key"] = new_user.username
     db.commit()
     db.refresh(new_user)
     return new_user
@@ -0,0 +1,129 @@
+"""
+API Эндпоинты для поиска по реестру документов.
+
+Используются, когда QR-код поврежден и документ нужно найти вручную.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.db import models
+from app.db.search import apply_search
+from app.schemas import document as doc_schema
+
+router = APIRouter()
+
+
+def _paginate(query, limit: int) -> doc_schema.DocumentSearchPage:
+    """
+    Выбирает страницу результатов.
+
+    Запрашивается на одну запись больше лимита, чтобы определить наличие
+    следующей страницы без дорогого COUNT(*) по реестру.
+
+    Args:
+        query: Упорядоченный запрос к RegistryDocument с примененным курсором.
+        limit (int): Размер страницы.
+
+    Returns:
+        DocumentSearchPage: Страница результатов.
+    """
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    return doc_schema.DocumentSearchPage(
+        items=rows[:limit],
+        limit=limit,
+        has_more=has_more,
+        next_after=rows[limit - 1].doc_id if has_more else None,
+    )
+
+
+@router.get("/search", response_model=doc_schema.DocumentSearchPage)
+def search_documents(
+    q: Optional[str] = Query(None, min_length=1, max_length=100),
+    doc_type: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: models.User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_read_db)
+):
+    """
+    Поиск документов по фамилии владельца и/или типу документа.
+
+    Строка q от 3 символов ищется как подстрока owner_name без учета
+    регистра; более короткая - как префикс owner_name с учетом регистра
+    ("Ли"). Тип документа сравнивается точно.
+
+    Args:
+        q (Optional[str]): Строка поиска по владельцу ("Иванов", "иван", "Ли").
+        doc_type (Optional[str]): Тип документа ("Паспорт").
+        after (Optional[str]): Курсор: next_after предыдущей страницы.
+        limit (int): Размер страницы.
+        current_user (models.User): Кто выполняет поиск.
+        db (Session): Сессия БД для чтения.
+
+    Returns:
+        DocumentSearchPage: Найденные документы.
+
+    Raises:
+        HTTPException: 400, если не задан ни q, ни doc_type или q состоит
+            из пробелов; 501, если СУБД не поддерживает поиск по реестру.
+    """
+    term = q.strip() if q is not None else None
+    if q is not None and not term:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Search term is blank")
+    if not term and not doc_type:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Specify q or doc_type")
+
+    try:
+        query = apply_search(
+            db.query(models.RegistryDocument), term, doc_type, after, db.get_bind().dialect.name
+        )
+    except NotImplementedError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+    return _paginate(query, limit)
+
+
+@router.get("/expiring", response_model=doc_schema.DocumentSearchPage)
+def expiring_documents(
+    doc_type: str,
+    days: int = Query(7, ge=1, le=365),
+    after: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: models.User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_read_db)
+):
+    """
+    Действующие документы указанного типа, срок которых скоро истекает.
+
+    Индекс (doc_type, expiration_date) сужает выборку до диапазона дат
+    нужного типа и отдает строки уже в порядке истечения срока; is_revoked
+    и остальные поля читаются из таблицы для каждой строки диапазона.
+
+    Args:
+        doc_type (str): Тип документа.
+        days (int): Горизонт в днях.
+        after (Optional[str]): Курсор: next_after предыдущей страницы.
+        limit (int): Размер страницы.
+        current_user (models.User): Кто выполняет поиск.
+        db (Session): Сессия БД для чтения.
+
+    Returns:
+        DocumentSearchPage: Документы в порядке истечения срока.
+    """
+    doc = models.RegistryDocument
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    query = db.query(doc).filter(
+        doc.doc_type == doc_type,
+        doc.expiration_date >= now,
+        doc.expiration_date < now + timedelta(days=days),
+        doc.is_revoked.is_(False),
+    )
+    if after is not None:
+        cursor_date = select(doc.expiration_date).where(doc.doc_id == after).scalar_subquery()
+        query = query.filter(tuple_(doc.expiration_date, doc.doc_id) > tuple_(cursor_date, after))
+    return _paginate(query.order_by(doc.expiration_date, doc.doc_id), limit)
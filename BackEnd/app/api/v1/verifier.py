@@ -17,6 +17,7 @@ router = APIRouter()
 def verify_document(
     request: doc_schema.VerifyRequest,
     current_user: models.User = Depends(deps.get_current_user),
+    read_db: Session = Depends(deps.get_read_db),
     db: Session = Depends(deps.get_db)
 ):
     """
@@ -30,13 +31,14 @@ def verify_document(
     Args:
         request (VerifyRequest): Данные QR-кода.
         current_user (models.User): Кто проверяет.
-        db (Session): Сессия БД.
+        read_db (Session): Сессия БД для чтения (поиск в реестре).
+        db (Session): Сессия БД для записи (журнал проверок).
 
     Returns:
         DocumentResponse: Результат проверки со статусом и сообщением.
     """
     doc_id = request.qr_code_data
-    doc = db.query(models.RegistryDocument).filter(models.RegistryDocument.doc_id == doc_id).first()
+    doc = read_db.query(models.RegistryDocument).filter(models.RegistryDocument.doc_id == doc_id).first()
     
     # Значения по умолчанию (Error case)
     status_res = models.ScanStatus.RED
@@ -74,6 +76,9 @@ def verify_document(
         scan_time=datetime.now(timezone.utc)
     )
     db.add(log_entry)
+    # Журнал не читается через реплики: запись не должна переводить
+    # чтения оператора на primary
+    db.info["sticky"] = False
     db.commit()
     db.refresh(log_entry)
     
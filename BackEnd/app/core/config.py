@@ -16,12 +16,26 @@ class Settings(BaseSettings):
         secret_key (str): Секретный ключ для подписи JWT токенов.
         algorithm (str): Алгоритм шифрования (например, HS256).
         access_token_expire_minutes (int): Время жизни токена доступа в минутах.
-        database_url (str): Строка подключения к базе данных (DSN).
+        database_url (str): Строка подключения к основной базе данных (DSN).
+        database_replica_urls (list[str]): DSN реплик только для чтения
+            (JSON-список, например '["sqlite:///./replica1.db"]').
+            Пустой список: все чтение идет в основную БД. Реплики должны
+            быть копиями основной БД (для SQLite - копиями файла после
+            первого запуска), иначе приложение не стартует.
+        replica_sticky_seconds (int): Сколько секунд после записи клиент
+            читает из основной БД (read-your-writes). Между процессами и
+            инстансами признак записи переносит только cookie; для клиентов
+            без cookie гарантия действует в пределах одного процесса.
+        replica_retry_seconds (int): На сколько секунд реплика, к которой не
+            удалось подключиться, исключается из ротации.
     """
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int
     database_url: str
+    database_replica_urls: list[str] = []
+    replica_sticky_seconds: int = 5
+    replica_retry_seconds: int = 30
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
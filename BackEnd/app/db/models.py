@@ -4,7 +4,7 @@ SQLAlchemy модели данных.
 Описывает структуру таблиц в базе данных.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime, timezone
 import enum
@@ -88,8 +88,20 @@ class RegistryDocument(Base):
         owner_name (str): Владелец.
         expiration_date (datetime): Срок действия.
         is_revoked (bool): Флаг отзыва документа.
+
+    Индексы:
+        (owner_name, doc_id): префиксный поиск по владельцу и постраничный
+            вывод в порядке владельца.
+        (doc_type, owner_name, doc_id): поиск по типу документа в том же
+            порядке.
+        (doc_type, expiration_date): выборка истекающих документов по типу.
     """
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_owner_name_doc_id", "owner_name", "doc_id"),
+        Index("ix_documents_doc_type_owner_name", "doc_type", "owner_name", "doc_id"),
+        Index("ix_documents_doc_type_expiration", "doc_type", "expiration_date"),
+    )
 
     doc_id = Column(String, primary_key=True, index=True)
     doc_type = Column(String)
@@ -0,0 +1,260 @@
+"""
+Модуль поиска по реестру документов.
+
+Поиск по владельцу:
+    SQLite: таблица FTS5 с токенизатором trigram (documents_fts) по полю
+    owner_name и триггеры, поддерживающие её в актуальном состоянии.
+    Неявный rowid таблицы documents нестабилен (первичный ключ doc_id
+    строковый, VACUUM может перенумеровать строки), поэтому FTS-таблица
+    хранит собственную копию owner_name и doc_id, а соответствие
+    doc_id -> rowid FTS лежит в documents_fts_keys.
+    PostgreSQL: GIN-индекс pg_trgm по owner_name, поиск через ILIKE.
+    Строки от 3 символов ищутся как подстрока без учета регистра, в том числе
+    в кириллице ("иван" -> "Иванов И.И."). Более короткие строки trigram-
+    индекс не обслуживает: для них выполняется префиксный поиск по B-tree
+    индексу (owner_name, doc_id) с учетом регистра ("Ли" -> "Ли А.").
+
+Тип документа сравнивается точно и обслуживается индексом
+(doc_type, owner_name, doc_id).
+
+Постраничный вывод - по курсору (doc_id последней записи страницы), без
+OFFSET: каждая страница читает из индекса только limit записей.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Integer, String, column, select, table, text, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query
+
+from app.db import models
+
+# Минимальная длина запроса, которую может обработать trigram-индекс.
+TRIGRAM_MIN_LENGTH = 3
+
+# Диалекты, для которых есть trigram-индекс по владельцу.
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")
+
+_FTS_TABLE = "documents_fts"
+_FTS_KEYS_TABLE = "documents_fts_keys"
+_FTS_COLUMNS = {"owner_name", "doc_id"}
+
+_fts = table(_FTS_TABLE, column("rowid", Integer), column("doc_id", String))
+_fts_keys = table(_FTS_KEYS_TABLE, column("doc_id", String), column("fts_rowid", Integer))
+
+_SQLITE_DROP = (
+    "DROP TRIGGER IF EXISTS documents_fts_ai",
+    "DROP TRIGGER IF EXISTS documents_fts_ad",
+    "DROP TRIGGER IF EXISTS documents_fts_au",
+    f"DROP TABLE IF EXISTS {_FTS_KEYS_TABLE}",
+    f"DROP TABLE IF EXISTS {_FTS_TABLE}",
+)
+
+_SQLITE_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE {_FTS_TABLE} USING fts5(
+        owner_name, doc_id UNINDEXED, tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TABLE {_FTS_KEYS_TABLE} (
+        doc_id VARCHAR PRIMARY KEY,
+        fts_rowid INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TRIGGER documents_fts_ai AFTER INSERT ON documents BEGIN
+        INSERT INTO {_FTS_TABLE}(owner_name, doc_id)
+        VALUES (new.owner_name, new.doc_id);
+        INSERT INTO {_FTS_KEYS_TABLE}(doc_id, fts_rowid)
+        VALUES (new.doc_id, last_insert_rowid());
+    END
+    """,
+    f"""
+    CREATE TRIGGER documents_fts_ad AFTER DELETE ON documents BEGIN
+        DELETE FROM {_FTS_TABLE} WHERE rowid =
+            (SELECT fts_rowid FROM {_FTS_KEYS_TABLE} WHERE doc_id = old.doc_id);
+        DELETE FROM {_FTS_KEYS_TABLE} WHERE doc_id = old.doc_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER documents_fts_au
+    AFTER UPDATE OF doc_id, owner_name ON documents BEGIN
+        DELETE FROM {_FTS_TABLE} WHERE rowid =
+            (SELECT fts_rowid FROM {_FTS_KEYS_TABLE} WHERE doc_id = old.doc_id);
+        DELETE FROM {_FTS_KEYS_TABLE} WHERE doc_id = old.doc_id;
+        INSERT INTO {_FTS_TABLE}(owner_name, doc_id)
+        VALUES (new.owner_name, new.doc_id);
+        INSERT INTO {_FTS_KEYS_TABLE}(doc_id, fts_rowid)
+        VALUES (new.doc_id, last_insert_rowid());
+    END
+    """,
+    f"""
+    INSERT INTO {_FTS_TABLE}(owner_name, doc_id)
+    SELECT owner_name, doc_id FROM documents
+    """,
+    f"""
+    INSERT INTO {_FTS_KEYS_TABLE}(doc_id, fts_rowid)
+    SELECT doc_id, rowid FROM {_FTS_TABLE}
+    """,
+)
+
+_POSTGRES_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE INDEX IF NOT EXISTS ix_documents_owner_name_trgm
+    ON documents USING gin (owner_name gin_trgm_ops)
+    """,
+    "DROP INDEX IF EXISTS ix_documents_doc_type_trgm",
+)
+
+
+def search_tables(dialect: str) -> list[str]:
+    """
+    Возвращает служебные таблицы поиска для указанного диалекта.
+
+    Args:
+        dialect (str): Имя диалекта БД (engine.dialect.name).
+
+    Returns:
+        list[str]: Имена таблиц помимо описанных в models.
+    """
+    if dialect == "sqlite":
+        return [_FTS_TABLE, _FTS_KEYS_TABLE]
+    return []
+
+
+def init_search_index(engine: Engine) -> None:
+    """
+    Создает индексы реестра, необходимые для поиска.
+
+    create_all() не добавляет индексы в уже существующие таблицы, поэтому
+    они создаются здесь явно (checkfirst). Для SQLite FTS-таблица создается
+    и заполняется из documents, если её еще нет или её формат устарел.
+    Для PostgreSQL создается индекс pg_trgm.
+
+    Args:
+        engine (Engine): Движок SQLAlchemy.
+    """
+    for index in models.RegistryDocument.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            keys_exist = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": _FTS_KEYS_TABLE},
+            ).first()
+            fts_columns = {
+                row[1] for row in conn.execute(text(f"PRAGMA table_info({_FTS_TABLE})"))
+            }
+            if not keys_exist or fts_columns != _FTS_COLUMNS:
+                for statement in _SQLITE_DROP + _SQLITE_DDL:
+                    conn.execute(text(statement))
+        elif engine.dialect.name == "postgresql":
+            for statement in _POSTGRES_DDL:
+                conn.execute(text(statement))
+
+
+def _fts_phrase(term: str) -> str:
+    """
+    Экранирует пользовательский ввод как фразу FTS5.
+
+    Args:
+        term (str): Строка поиска.
+
+    Returns:
+        str: Строка в двойных кавычках, безопасная для MATCH.
+    """
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    """
+    Экранирует пользовательский ввод для поиска подстроки через LIKE.
+
+    Args:
+        term (str): Строка поиска.
+
+    Returns:
+        str: Шаблон вида %term% с экранированными %, _ и \\.
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _order_by_owner(query: Query, after: Optional[str]) -> Query:
+    """
+    Упорядочивает запрос по (owner_name, doc_id) и применяет курсор.
+
+    Args:
+        query (Query): Запрос к RegistryDocument.
+        after (Optional[str]): doc_id последней записи предыдущей страницы.
+
+    Returns:
+        Query: Упорядоченный запрос.
+    """
+    doc = models.RegistryDocument
+    if after is not None:
+        cursor_owner = select(doc.owner_name).where(doc.doc_id == after).scalar_subquery()
+        query = query.filter(tuple_(doc.owner_name, doc.doc_id) > tuple_(cursor_owner, after))
+    return query.order_by(doc.owner_name, doc.doc_id)
+
+
+def apply_search(
+    query: Query,
+    term: Optional[str],
+    doc_type: Optional[str],
+    after: Optional[str],
+    dialect: str,
+) -> Query:
+    """
+    Добавляет к запросу фильтры поиска, порядок и курсор страницы.
+
+    Порядок результатов:
+        - поиск подстроки по владельцу в SQLite: порядок добавления в реестр
+          (rowid FTS-таблицы), без сортировки всех совпадений;
+        - остальные случаи: по владельцу, затем по doc_id.
+
+    Args:
+        query (Query): Запрос к RegistryDocument.
+        term (Optional[str]): Строка поиска по владельцу (без пробелов по краям).
+        doc_type (Optional[str]): Точный тип документа.
+        after (Optional[str]): doc_id последней записи предыдущей страницы.
+        dialect (str): Имя диалекта БД (engine.dialect.name).
+
+    Returns:
+        Query: Упорядоченный запрос без LIMIT.
+
+    Raises:
+        NotImplementedError: Если для диалекта нет trigram-индекса.
+    """
+    doc = models.RegistryDocument
+    if doc_type:
+        query = query.filter(doc.doc_type == doc_type)
+
+    if not term:
+        return _order_by_owner(query.filter(doc.owner_name.isnot(None)), after)
+
+    if len(term) < TRIGRAM_MIN_LENGTH:
+        # Диапазон [term, term + U+FFFF) эквивалентен LIKE 'term%', но
+        # гарантированно обслуживается индексом независимо от collation.
+        query = query.filter(doc.owner_name >= term, doc.owner_name < term + "\uffff")
+        return _order_by_owner(query, after)
+
+    if dialect == "sqlite":
+        query = query.join(_fts, _fts.c.doc_id == doc.doc_id).filter(
+            text(f"{_FTS_TABLE} MATCH :fts_match").bindparams(fts_match=_fts_phrase(term))
+        )
+        if after is not None:
+            cursor_rowid = (
+                select(_fts_keys.c.fts_rowid).where(_fts_keys.c.doc_id == after).scalar_subquery()
+            )
+            query = query.filter(_fts.c.rowid > cursor_rowid)
+        return query.order_by(_fts.c.rowid)
+
+    if dialect == "postgresql":
+        query = query.filter(doc.owner_name.ilike(_like_pattern(term), escape="\\"))
+        return _order_by_owner(query, after)
+
+    raise NotImplementedError(f"Registry search is not supported for {dialect}")
@@ -1,18 +1,245 @@
 """
 Модуль сессии базы данных.
 
-Отвечает за создание движка (Engine) и фабрики сессий (SessionLocal).
+Отвечает за создание движков (Engine) и фабрик сессий.
+
+Запись всегда идет в основную БД (primary) через SessionLocal. Чтение может
+обслуживаться репликами (settings.database_replica_urls), которые выбираются
+по кругу (round-robin). Реплика, к которой не удалось подключиться,
+исключается из ротации на settings.replica_retry_seconds, а чтение
+переходит на следующую реплику и в крайнем случае на primary.
+
+Клиент, недавно выполнивший запись, в течение settings.replica_sticky_seconds
+читает из primary (read-your-writes), чтобы не увидеть устаревшие данные из-за
+задержки репликации. Признак записи передается двумя путями:
+    - cookie с временем записи (см. deps.get_db), который работает при
+      нескольких воркерах и инстансах, если клиент хранит cookie;
+    - словарь _last_write по логину (sub из JWT). Он хранится в памяти
+      процесса и поэтому гарантирует read-your-writes только в пределах
+      одного процесса (uvicorn без --workers).
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import itertools
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
-# Создание движка SQLAlchemy.
-# connect_args={"check_same_thread": False} используется только для SQLite.
-engine = create_engine(
-    settings.database_url, connect_args={"check_same_thread": False}
-)
 
-# Фабрика для создания сессий базы данных.
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+def _create_engine(url: str) -> Engine:
+    """
+    Создает движок SQLAlchemy для указанного DSN.
+
+    connect_args={"check_same_thread": False} используется только для SQLite.
+
+    Args:
+        url (str): Строка подключения.
+
+    Returns:
+        Engine: Движок SQLAlchemy.
+    """
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    return create_engine(url, connect_args=connect_args)
+
+
+# Основной движок (primary): все записи и чтения, требующие свежих данных.
+engine = _create_engine(settings.database_url)
+
+# Движки реплик только для чтения. Если реплик нет, чтение идет в primary.
+replica_engines = [_create_engine(url) for url in settings.database_replica_urls]
+
+# Фабрика для создания сессий базы данных (запись, primary).
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Фабрика сессий для чтения. Соединение передается при создании сессии
+# (см. connect_for_read).
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+logger = logging.getLogger(__name__)
+
+_replica_cycle = itertools.cycle(replica_engines)
+_replica_lock = threading.Lock()
+
+# До какого момента (time.monotonic()) реплика исключена из ротации.
+_unhealthy_until: dict[Engine, float] = {}
+
+# Время последней записи по пользователю (time.monotonic()).
+_last_write: dict[str, float] = {}
+_last_write_lock = threading.Lock()
+_last_sweep = 0.0
+
+
+def next_replica_engine() -> Optional[Engine]:
+    """
+    Выбирает следующую доступную реплику по кругу (round-robin).
+
+    Реплики, отмеченные недоступными, пропускаются до конца их таймаута.
+
+    Returns:
+        Optional[Engine]: Движок реплики или None, если доступных реплик нет.
+    """
+    now = time.monotonic()
+    with _replica_lock:
+        for _ in range(len(replica_engines)):
+            replica = next(_replica_cycle)
+            if _unhealthy_until.get(replica, 0.0) <= now:
+                return replica
+    return None
+
+
+def mark_unhealthy(replica: Engine) -> None:
+    """
+    Исключает реплику из ротации на settings.replica_retry_seconds.
+
+    Args:
+        replica (Engine): Движок реплики.
+    """
+    with _replica_lock:
+        _unhealthy_until[replica] = time.monotonic() + settings.replica_retry_seconds
+    logger.warning(
+        "Replica %s is unavailable, skipping it for %s s",
+        replica.url, settings.replica_retry_seconds,
+    )
+
+
+def connect_for_read(use_primary: bool) -> Connection:
+    """
+    Открывает соединение для чтения.
+
+    Перебирает доступные реплики; при ошибке подключения реплика
+    исключается из ротации и пробуется следующая. Если реплик нет, все
+    недоступны или нужно читать свои записи, используется primary.
+
+    Args:
+        use_primary (bool): Читать из primary (read-your-writes).
+
+    Returns:
+        Connection: Открытое соединение.
+    """
+    if not use_primary:
+        for _ in range(len(replica_engines)):
+            replica = next_replica_engine()
+            if replica is None:
+                break
+            try:
+                return replica.connect()
+            except DBAPIError:
+                mark_unhealthy(replica)
+    return engine.connect()
+
+
+def mark_write(key: str) -> None:
+    """
+    Запоминает, что пользователь только что выполнил запись.
+
+    Устаревшие отметки удаляются не чаще раза в replica_sticky_seconds,
+    чтобы словарь не рос бесконечно и не сканировался на каждой записи.
+
+    Args:
+        key (str): Логин пользователя (см. deps.get_db).
+    """
+    global _last_sweep
+    now = time.monotonic()
+    ttl = settings.replica_sticky_seconds
+    with _last_write_lock:
+        _last_write[key] = now
+        if now - _last_sweep < ttl:
+            return
+        _last_sweep = now
+        expired = [k for k, ts in _last_write.items() if now - ts >= ttl]
+        for k in expired:
+            del _last_write[k]
+
+
+def is_sticky(key: Optional[str]) -> bool:
+    """
+    Проверяет, должен ли пользователь читать из primary.
+
+    Args:
+        key (Optional[str]): Логин пользователя или None для анонимных запросов.
+
+    Returns:
+        bool: True, если пользователь выполнял запись в пределах окна stickiness.
+    """
+    if not key:
+        return False
+    now = time.monotonic()
+    with _last_write_lock:
+        ts = _last_write.get(key)
+        if ts is None:
+            return False
+        if now - ts < settings.replica_sticky_seconds:
+            return True
+        del _last_write[key]
+        return False
+
+
+def check_replica_schema(replica: Engine, required: set[str]) -> None:
+    """
+    Проверяет, что на реплике есть все таблицы схемы.
+
+    Схема создается только на primary; реплики должны быть его физическими
+    копиями (для локальной проверки на SQLite - копиями файла primary,
+    сделанными после первого запуска приложения).
+
+    Недоступная реплика не мешает запуску: она исключается из ротации,
+    как при ошибке подключения во время работы.
+
+    Args:
+        replica (Engine): Движок реплики.
+        required (set[str]): Имена обязательных таблиц.
+
+    Raises:
+        RuntimeError: Если каких-либо таблиц на реплике нет.
+    """
+    try:
+        tables = set(inspect(replica).get_table_names())
+    except DBAPIError:
+        mark_unhealthy(replica)
+        return
+    missing = required - tables
+    if missing:
+        raise RuntimeError(
+            f"Replica {replica.url!r} is missing tables {sorted(missing)}; "
+            "replicas must be copies of the primary database"
+        )
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _track_flush(session: Session, flush_context) -> None:
+    """Отмечает, что в транзакции сессии были изменения."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _track_commit(session: Session) -> None:
+    """
+    После фиксации изменений включает stickiness для пользователя сессии.
+
+    Пути, которые пишут данные, не читаемые потом через реплики (журнал
+    проверок), отключают это через session.info["sticky"] = False.
+    Колбэк session.info["on_sticky_write"] (если задан) сообщает о записи
+    клиенту (см. deps.get_db).
+    """
+    has_writes = session.info.pop("has_writes", False)
+    sticky = session.info.pop("sticky", True)
+    if has_writes and sticky:
+        key = session.info.get("sticky_key")
+        if key:
+            mark_write(key)
+        on_sticky_write = session.info.get("on_sticky_write")
+        if on_sticky_write:
+            on_sticky_write()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _reset_writes(session: Session) -> None:
+    """Отмененные изменения не требуют stickiness."""
+    session.info.pop("has_writes", None)
+    session.info.pop("sticky", None)
@@ -10,8 +10,9 @@ from datetime import datetime, timedelta, timezone
 from fastapi import FastAPI
 
 from app.db import models
-from app.db.session import engine, SessionLocal
-from app.api.v1 import auth, users, verifier
+from app.db.search import init_search_index, search_tables
+from app.db.session import engine, SessionLocal, replica_engines, check_replica_schema
+from app.api.v1 import auth, users, verifier, registry
 
 
 @asynccontextmanager
@@ -29,6 +30,16 @@ async def lifespan(app: FastAPI):
     
     # 1. Создаем таблицы в БД (если их нет)
     models.Base.metadata.create_all(bind=engine)
+
+    # 1.1. Индексы и FTS-таблица для поиска по реестру
+    init_search_index(engine)
+
+    # 1.2. Реплики - копии primary: проверяем, что схема на них есть
+    for replica in replica_engines:
+        check_replica_schema(
+            replica,
+            set(models.Base.metadata.tables) | set(search_tables(replica.dialect.name)),
+        )
     
     # 2. Заполняем базу тестовыми данными (Seeding)
     db = SessionLocal()
@@ -89,6 +100,7 @@ app = FastAPI(
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
 app.include_router(verifier.router, prefix="/api/v1/verify", tags=["Scanner"])
+app.include_router(registry.router, prefix="/api/v1/registry", tags=["Registry"])
 
 
 @app.get("/")
@@ -37,4 +37,42 @@ class DocumentResponse(BaseModel):
     doc_type: Optional[str] = None
     owner_name: Optional[str] = None
     verification_id: int
-    timestamp: datetime
\ No newline at end of file
+    timestamp: datetime
+
+
+class RegistryDocumentResponse(BaseModel):
+    """
+    Запись реестра в результатах поиска.
+
+    Attributes:
+        doc_id (str): ID документа.
+        doc_type (Optional[str]): Тип документа.
+        owner_name (Optional[str]): Владелец.
+        expiration_date (Optional[datetime]): Срок действия.
+        is_revoked (bool): Флаг отзыва документа.
+    """
+    doc_id: str
+    doc_type: Optional[str] = None
+    owner_name: Optional[str] = None
+    expiration_date: Optional[datetime] = None
+    is_revoked: bool = False
+
+    class Config:
+        from_attributes = True
+
+
+class DocumentSearchPage(BaseModel):
+    """
+    Страница результатов поиска по реестру.
+
+    Attributes:
+        items (list[RegistryDocumentResponse]): Найденные документы.
+        limit (int): Размер страницы.
+        has_more (bool): Есть ли следующая страница.
+        next_after (Optional[str]): Курсор следующей страницы (doc_id
+            последней записи), передается в параметре after.
+    """
+    items: list[RegistryDocumentResponse]
+    limit: int
+    has_more: bool
+    next_after: Optional[str] = None